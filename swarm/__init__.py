@@ -10,31 +10,59 @@ A lightweight multi-model agent system that:
 - Maintains conversation history
 """
 
-from .config import MODEL_CATALOG, TASK_REQUIREMENTS, HARDWARE_PROFILES
-from .config_default import (
-    load_config,
-    save_config,
-    show_config,
-    get_recommended_model,
-    detect_hardware_profile,
-    CONFIG_DIR,
-    CONFIG_FILE,
+import importlib
+
+from .config import (
+    MODEL_CATALOG,
+    TASK_REQUIREMENTS,
+    HARDWARE_PROFILES,
+    ModelInfo,
+    TaskReq,
 )
-from .hardware import HardwareDetector
-from .registry import ModelRegistry
-from .downloader import ModelDownloader
-from .uninstaller import ModelUninstaller
-from .selector import ModelSelector
-from .voter import SwarmVoter
-from .analyzer import TaskAnalyzer
-from .orchestrator import SwarmOrchestrator
-from .intent import classify_intent, classify_intent_with_model
-from .conversation import ConversationManager
+
+# Heavier submodules (ollama client, psutil) are imported on first access
+# so that CLI paths like `swarm config` only pay for what they use.
+_LAZY = {
+    "load_config": ".config_default",
+    "save_config": ".config_default",
+    "show_config": ".config_default",
+    "get_recommended_model": ".config_default",
+    "detect_hardware_profile": ".config_default",
+    "CONFIG_DIR": ".config_default",
+    "CONFIG_FILE": ".config_default",
+    "HardwareDetector": ".hardware",
+    "ModelRegistry": ".registry",
+    "ModelDownloader": ".downloader",
+    "ModelUninstaller": ".uninstaller",
+    "ModelSelector": ".selector",
+    "SwarmVoter": ".voter",
+    "TaskAnalyzer": ".analyzer",
+    "SwarmOrchestrator": ".orchestrator",
+    "classify_intent": ".intent",
+    "classify_intent_with_model": ".intent",
+    "ConversationManager": ".conversation",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "MODEL_CATALOG",
     "TASK_REQUIREMENTS",
     "HARDWARE_PROFILES",
+    "ModelInfo",
+    "TaskReq",
     "load_config",
     "save_config",
     "show_config",
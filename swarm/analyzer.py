@@ -2,10 +2,111 @@
 Task Analyzer - Analyze tasks using tiny model to determine requirements
 """
 
+import asyncio
 import ollama
-import re
 import json
-from typing import Dict
+import os
+import re
+from typing import Dict, List, Optional
+
+# Keyword tables hold regex stems matched as whole words, so inflections
+# count ("optimizing", "complexity") but "latest" is not "test", "address"
+# is not "add" and "systemd" is not "system".
+COMPLEX_KEYWORDS = frozenset(
+    [
+        r"algorithm\w*",
+        r"optimi[sz]\w*",
+        r"architect\w*",
+        r"systems?",
+        r"multiple",
+        r"integrat\w*",
+        r"apis?",
+        r"databases?",
+        r"complex\w*",
+    ]
+)
+SIMPLE_KEYWORDS = frozenset(
+    [
+        r"simpl(?:e|er|est|y)",
+        r"basic\w*",
+        r"hello",
+        r"add(?:s|ed|ing)?",
+        r"print\w*",
+        r"return\w*",
+    ]
+)
+
+# Checked in order; first table with a hit decides the task type.
+TYPE_KEYWORDS = (
+    (
+        "debug",
+        frozenset(
+            [r"debug\w*", r"fix\w*", r"bugs?", r"errors?", r"traceback\w*", r"crash\w*"]
+        ),
+    ),
+    ("test", frozenset([r"test(?:s|ed|ing)?", r"unittest\w*", r"pytest\w*"])),
+    ("review", frozenset([r"review\w*", r"audit\w*"])),
+    (
+        "code",
+        frozenset(
+            [
+                r"writ(?:e|es|ing|ten)",
+                r"creat(?:e|es|ed|ing)",
+                r"implement\w*",
+                r"functions?",
+                r"scripts?",
+                r"class(?:es)?",
+                r"build\w*",
+            ]
+        ),
+    ),
+)
+
+
+def _keyword_re(keywords) -> re.Pattern:
+    """Compile keyword stems into one whole-word alternation for a single scan."""
+    return re.compile(r"\b(?:" + "|".join(sorted(keywords)) + r")\b")
+
+
+_COMPLEX_RE = _keyword_re(COMPLEX_KEYWORDS)
+_SIMPLE_RE = _keyword_re(SIMPLE_KEYWORDS)
+_TYPE_RES = tuple((task_type, _keyword_re(kws)) for task_type, kws in TYPE_KEYWORDS)
+
+
+def _extract_json_object(s: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in `s`, or None.
+
+    Single pass tracking brace depth; braces inside "..." strings
+    (including escaped quotes) are ignored.
+    """
+    start = s.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start : i + 1]
+
+    return None
 
 
 class TaskAnalyzer:
@@ -13,12 +114,84 @@ class TaskAnalyzer:
 
     def __init__(self, config):
         self.config = config
+        self._cache: Dict[str, Dict] = {}
+        # One client per analyzer so HTTP connections are kept alive
+        self._host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        self._client = ollama.Client(host=self._host)
 
     def analyze(self, goal: str) -> Dict:
         """
         Analyze task to determine model requirements.
         Uses tiny model for fast classification.
+        Results are cached per goal string.
+        """
+        result = self._cache.get(goal)
+        if result is not None:
+            return result
+
+        result = self._screen(goal)
+        if result is None:
+            try:
+                response = self._client.chat(**self._chat_kwargs(goal))
+            except Exception:
+                # Not cached, so the model is asked again once it is reachable
+                return self._fallback(goal)
+            result = self._from_reply(goal, response)
+
+        self._cache[goal] = result
+        return result
+
+    def analyze_many(self, goals: List[str]) -> List[Dict]:
+        """
+        Analyze several tasks concurrently.
+
+        All classification prompts are sent at once so Ollama can serve
+        them in parallel (see OLLAMA_NUM_PARALLEL). Results keep the
+        order of `goals`.
         """
+        pending = [g for g in dict.fromkeys(goals) if g not in self._cache]
+
+        async def _gather():
+            # asyncio.run makes a fresh loop each call, so the client (whose
+            # connection pool is bound to that loop) lives for one batch
+            async with ollama.AsyncClient(host=self._host) as client:
+                return await asyncio.gather(
+                    *[self._analyze_async(client, g) for g in pending]
+                )
+
+        fresh = dict(zip(pending, asyncio.run(_gather()))) if pending else {}
+
+        return [fresh[g] if g in fresh else self._cache[g] for g in goals]
+
+    async def _analyze_async(self, client: ollama.AsyncClient, goal: str) -> Dict:
+        """Analyze a single task without blocking the event loop."""
+        result = self._screen(goal)
+        if result is None:
+            try:
+                response = await client.chat(**self._chat_kwargs(goal))
+            except Exception:
+                return self._fallback(goal)
+            result = self._from_reply(goal, response)
+
+        self._cache[goal] = result
+        return result
+
+    def _screen(self, goal: str) -> Optional[Dict]:
+        """Cheap keyword screen; None means the model has to decide."""
+        complexity = self._estimate_complexity(goal)
+        task_type = self._estimate_type(goal)
+        if complexity == "medium" or task_type == "general":
+            return None
+
+        return {
+            "type": task_type,
+            "complexity": complexity,
+            "needs_reasoning": complexity == "complex"
+            or task_type in ("debug", "review"),
+        }
+
+    def _chat_kwargs(self, goal: str) -> Dict:
+        """Build the classification request for `goal`."""
         prompt = f"""Analyze this coding task. Reply with ONLY a JSON object.
 
 Task: "{goal}"
@@ -33,21 +206,36 @@ Rules:
 
 JSON only:"""
 
-        try:
-            response = ollama.chat(
-                model=self.ANALYZER_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                options={"num_predict": 50, "temperature": 0.1},
-            )
+        return {
+            "model": self.ANALYZER_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "options": {"num_predict": 50, "temperature": 0.1},
+        }
 
-            content = response["message"]["content"]
+    def _parse(self, content: str) -> Optional[Dict]:
+        """Extract the JSON verdict from a model reply."""
+        # Well-behaved replies are bare JSON; skip the scan for those
+        if content.lstrip().startswith("{"):
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                pass
 
-            json_match = re.search(r"\{[^}]+\}", content)
-            if json_match:
-                return json.loads(json_match.group())
+        json_text = _extract_json_object(content)
+        if json_text:
+            return json.loads(json_text)
+        return None
+
+    def _from_reply(self, goal: str, response) -> Dict:
+        """Verdict from a model reply, or the heuristic if it is unparseable."""
+        try:
+            result = self._parse(response["message"]["content"])
         except Exception:
-            pass
+            result = None
+        return result or self._fallback(goal)
 
+    def _fallback(self, goal: str) -> Dict:
+        """Heuristic answer when the model is unavailable or unparseable."""
         return {
             "type": "code",
             "complexity": self._estimate_complexity(goal),
@@ -58,29 +246,24 @@ JSON only:"""
         """Quick complexity estimation based on keywords."""
         goal_lower = goal.lower()
 
-        complex_keywords = [
-            "algorithm",
-            "optimize",
-            "architecture",
-            "system",
-            "multiple",
-            "integrate",
-            "api",
-            "database",
-            "complex",
-        ]
-        simple_keywords = ["simple", "basic", "hello", "add", "print", "return"]
-
-        for kw in complex_keywords:
-            if kw in goal_lower:
-                return "complex"
-
-        for kw in simple_keywords:
-            if kw in goal_lower:
-                return "simple"
+        if _COMPLEX_RE.search(goal_lower):
+            return "complex"
+
+        if _SIMPLE_RE.search(goal_lower):
+            return "simple"
 
         return "medium"
 
+    def _estimate_type(self, goal: str) -> str:
+        """Quick task type estimation based on keywords."""
+        goal_lower = goal.lower()
+
+        for task_type, pattern in _TYPE_RES:
+            if pattern.search(goal_lower):
+                return task_type
+
+        return "general"
+
     def classify_complexity(self, goal: str) -> str:
         """Quick complexity check."""
         result = self.analyze(goal)
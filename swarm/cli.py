@@ -3,11 +3,15 @@ Swarm CLI - Command-line interface for config and model management.
 """
 
 import argparse
-import json
+import math
+import ollama
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 # Handle both package and direct imports
 try:
@@ -17,7 +21,11 @@ try:
         show_config,
         get_recommended_model,
         detect_hardware_profile,
+        CONFIG_DIR,
+        CONFIG_FILE,
     )
+    from .hardware import HardwareDetector
+    from .jsonio import loads
 except ImportError:
     from config_default import (
         load_config,
@@ -25,9 +33,31 @@ except ImportError:
         show_config,
         get_recommended_model,
         detect_hardware_profile,
+        CONFIG_DIR,
+        CONFIG_FILE,
     )
+    from hardware import HardwareDetector
+    from jsonio import loads
 
-CONFIG_DIR = Path.home() / ".swarm-config"
+
+def _list_models() -> List[Tuple[str, str]]:
+    """Installed models as (name, size) pairs."""
+    try:
+        return [
+            (m.get("model") or m.get("name"), f"{m['size'] // (1024**2)}MB")
+            for m in ollama.list()["models"]
+        ]
+    except Exception:
+        return []
+
+
+def _remove_model(model: str) -> bool:
+    """Remove an installed model."""
+    try:
+        ollama.delete(model)
+        return True
+    except Exception:
+        return False
 
 
 def cmd_config(args):
@@ -37,24 +67,31 @@ def cmd_config(args):
 
         # Parse value type
         value = args.set_value
-        if value.lower() == "true":
-            value = True
-        elif value.lower() == "false":
-            value = False
-        elif value.isdigit():
-            value = int(value)
-        elif value.replace(".", "").isdigit():
-            value = float(value)
+        if value.lower() in ("true", "false"):
+            value = value.lower() == "true"
+        else:
+            try:
+                value = int(value)
+            except ValueError:
+                try:
+                    number = float(value)
+                except ValueError:
+                    pass
+                else:
+                    # "nan"/"inf" parse as floats but aren't valid JSON
+                    if math.isfinite(number):
+                        value = number
 
         config[args.set_key] = value
         save_config(config)
         print(f"✓ Set {args.set_key} = {value}")
 
     elif args.edit:
-        editor = subprocess.run(["which", "nano", "vim", "vi"], capture_output=True)
-        editor_cmd = editor.stdout.decode().strip().split("\n")[0] or "nano"
-        config_file = CONFIG_DIR / "config.json"
-        subprocess.run([editor_cmd, str(config_file)])
+        # $EDITOR may carry arguments, e.g. "code --wait"
+        editor_cmd = shlex.split(os.environ.get("EDITOR", "")) or [
+            next((e for e in ("nano", "vim", "vi") if shutil.which(e)), "nano")
+        ]
+        subprocess.run(editor_cmd + [str(CONFIG_FILE)])
 
     else:
         print(show_config())
@@ -80,11 +117,11 @@ def cmd_models(args):
         registry_file = Path.home() / ".swarm" / "model_registry.json"
         if registry_file.exists():
             try:
-                registry = json.loads(registry_file.read_text())
+                registry = loads(registry_file.read_bytes())
                 for model in registry.get("downloaded_by_swarm", []):
                     if model not in keep_models:
                         print(f"  Removing: {model}")
-                        subprocess.run(["ollama", "rm", model], capture_output=True)
+                        _remove_model(model)
             except Exception as e:
                 print(f"  Error: {e}")
 
@@ -99,14 +136,8 @@ def cmd_models(args):
     else:
         print("Installed models:")
         print()
-        result = subprocess.run(["ollama", "list"], capture_output=True, text=True)
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n")[1:]:
-                if line.strip():
-                    parts = line.split()
-                    model = parts[0]
-                    size = parts[2] if len(parts) > 2 else "?"
-                    print(f"  • {model} ({size})")
+        for model, size in _list_models():
+            print(f"  • {model} ({size})")
 
         print()
         config = load_config()
@@ -117,16 +148,13 @@ def cmd_models(args):
 
 def cmd_hardware(args):
     """Show hardware info."""
-    import psutil
-
-    ram = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
+    hw = HardwareDetector().detect()
 
     print("Hardware Info:")
-    print(f"  RAM: {ram.total / (1024**3):.1f}GB total")
-    print(f"       {ram.available / (1024**3):.1f}GB available")
-    print(f"  CPU cores: {psutil.cpu_count()}")
-    print(f"  Free disk: {disk.free / (1024**3):.1f}GB")
+    print(f"  RAM: {hw['total_ram_gb']:.1f}GB total")
+    print(f"       {hw['available_ram_gb']:.1f}GB available")
+    print(f"  CPU cores: {hw['cpu_cores']}")
+    print(f"  Free disk: {hw['free_disk_gb']:.1f}GB")
 
     profile = detect_hardware_profile()
     recommended = get_recommended_model(profile)
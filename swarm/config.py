@@ -2,7 +2,65 @@
 Swarm Configuration - Model Catalog, Task Mapping, Hardware Profiles
 """
 
-MODEL_CATALOG = {
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Optional
+
+# One bit per capability so "model has all required caps" is a single AND
+CAPABILITY_BITS = {
+    "classification": 1,
+    "voting": 2,
+    "simple_code": 4,
+    "routing": 8,
+    "code_generation": 16,
+    "debugging": 32,
+    "refactoring": 64,
+    "review": 128,
+    "reasoning": 256,
+    "complex_code": 512,
+    "architecture": 1024,
+    "analysis": 2048,
+}
+
+
+def capability_mask(capabilities: Iterable[str]) -> int:
+    """Combine capability names into a CAPABILITY_BITS mask."""
+    mask = 0
+    for cap in capabilities:
+        mask |= CAPABILITY_BITS[cap]
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class ModelInfo:
+    """Static metadata for a catalog model."""
+
+    size_mb: int
+    ram_mb: int
+    tier: int
+    capabilities: FrozenSet[str]
+    speed_rating: int
+    code_quality: int
+    reasoning_quality: int
+    always_keep: bool = False
+    cap_mask: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class TaskReq:
+    """Model requirements for a task type."""
+
+    min_capabilities: FrozenSet[str] = frozenset()
+    min_tier: int = 0
+    prefer_tier: int = 0
+    complexity_upgrade: Dict[str, int] = field(default_factory=dict)
+    num_predict: Dict[str, int] = field(default_factory=dict)
+    voter_count: Optional[int] = None
+    min_cap_mask: int = 0
+
+
+# Ollama's default tags are already 4-bit builds (Q4_0 / Q4_K_M); sizes below
+# are those downloads, so voters need no separate quantized variant
+MODEL_CATALOG_RAW = {
     "qwen2.5:0.5b": {
         "size_mb": 397,
         "ram_mb": 500,
@@ -55,7 +113,7 @@ MODEL_CATALOG = {
     },
 }
 
-TASK_REQUIREMENTS = {
+TASK_REQUIREMENTS_RAW = {
     "routing": {
         "min_capabilities": ["classification"],
         "min_tier": 0,
@@ -69,6 +127,12 @@ TASK_REQUIREMENTS = {
             "medium": 1,
             "complex": 2,
         },
+        # Generation cap per complexity; most skills are well under these
+        "num_predict": {
+            "simple": 300,
+            "medium": 600,
+            "complex": 1200,
+        },
     },
     "simple_code": {
         "min_capabilities": ["simple_code"],
@@ -93,6 +157,28 @@ TASK_REQUIREMENTS = {
     },
 }
 
+MODEL_CATALOG = {
+    name: ModelInfo(
+        **{
+            **info,
+            "capabilities": frozenset(info["capabilities"]),
+            "cap_mask": capability_mask(info["capabilities"]),
+        }
+    )
+    for name, info in MODEL_CATALOG_RAW.items()
+}
+
+TASK_REQUIREMENTS = {
+    name: TaskReq(
+        **{
+            **req,
+            "min_capabilities": frozenset(req.get("min_capabilities", [])),
+            "min_cap_mask": capability_mask(req.get("min_capabilities", [])),
+        }
+    )
+    for name, req in TASK_REQUIREMENTS_RAW.items()
+}
+
 HARDWARE_PROFILES = {
     "minimal": {
         "min_ram_gb": 4,
@@ -2,11 +2,19 @@
 Default configuration and hardware auto-detection for The Swarm.
 """
 
+import functools
 import json
-import psutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Handle both package and direct imports
+try:
+    from .hardware import HardwareDetector
+    from .jsonio import dumps, dumps_bytes, loads
+except ImportError:
+    from hardware import HardwareDetector
+    from jsonio import dumps, dumps_bytes, loads
+
 CONFIG_DIR = Path.home() / ".swarm-config"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -48,20 +56,18 @@ MODEL_RECOMMENDATIONS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def detect_hardware_profile() -> str:
-    """Detect hardware profile based on available RAM."""
-    ram_gb = psutil.virtual_memory().total / (1024**3)
+    """
+    Detect hardware profile based on available RAM.
 
-    if ram_gb >= 24:
-        return "powerful"
-    elif ram_gb >= 12:
-        return "moderate"
-    elif ram_gb >= 6:
-        return "limited"
-    else:
-        return "minimal"
+    Computed once per process; call detect_hardware_profile.cache_clear()
+    to force re-detection.
+    """
+    return HardwareDetector().get_profile()
 
 
+@functools.lru_cache(maxsize=8)
 def get_recommended_model(profile: str = None) -> str:
     """Get recommended default model for hardware profile."""
     if profile is None:
@@ -75,7 +81,7 @@ def get_recommended_model(profile: str = None) -> str:
 def create_default_config() -> Dict[str, Any]:
     """Create default config with auto-detected values."""
     profile = detect_hardware_profile()
-    ram_gb = int(psutil.virtual_memory().total / (1024**3))
+    ram_gb = int(HardwareDetector().detect()["total_ram_gb"])
 
     config = DEFAULT_CONFIG.copy()
     config["hardware_profile"] = profile
@@ -90,8 +96,7 @@ def load_config() -> Dict[str, Any]:
     """Load config from file, creating default if not exists."""
     if CONFIG_FILE.exists():
         try:
-            with open(CONFIG_FILE) as f:
-                config = json.load(f)
+            config = loads(CONFIG_FILE.read_bytes())
 
             # Resolve "auto" for default_model
             if config.get("default_model") == "auto":
@@ -113,8 +118,7 @@ def save_config(config: Dict[str, Any]) -> None:
     """Save config to file."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_FILE.write_bytes(dumps_bytes(config))
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
@@ -133,4 +137,4 @@ def set_config_value(key: str, value: Any) -> None:
 def show_config() -> str:
     """Return formatted config."""
     config = load_config()
-    return json.dumps(config, indent=2)
+    return dumps(config)
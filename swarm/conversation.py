@@ -2,47 +2,146 @@
 Conversation manager for follow-up questions.
 """
 
+import atexit
 import json
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from .config_default import CONFIG_DIR
+from .jsonio import dumps, loads
+
 
 class ConversationManager:
     """Manages conversation history for chat mode."""
 
-    def __init__(self, config_dir: Path = None, max_history: int = 20):
-        if config_dir is None:
-            config_dir = Path.home() / ".swarm-config"
+    # Buffered messages are written once this many are pending
+    FLUSH_EVERY = 4
 
-        self.history_file = config_dir / "conversation_history.json"
+    def __init__(self, config_dir: Path = None, max_history: int = 20):
+        config_dir = config_dir or CONFIG_DIR
+        self.history_file = config_dir / "conversation_history.jsonl"
+        # Whole-file JSON list written by earlier versions; imported once
+        self.legacy_file = config_dir / "conversation_history.json"
         self.max_history = max_history
-        self._history: List[Dict] = []
+        # Struct-of-arrays: parallel lists instead of one dict per message
+        self._roles: List[str] = []
+        self._contents: List[str] = []
+        self._timestamps: List[str] = []
+        self._file_lines = 0
+        self._pending: List[Dict] = []
         self._load()
+        atexit.register(self.flush)
 
     def _load(self):
-        """Load history from file."""
-        if self.history_file.exists():
-            try:
-                self._history = json.loads(self.history_file.read_text())
-            except (json.JSONDecodeError, KeyError):
-                self._history = []
-        else:
-            self._history = []
-
-    def _save(self):
-        """Save history to file."""
+        """Load history from file (one JSON record per line)."""
+        self._reset()
+
+        if not self.history_file.exists():
+            if self.legacy_file.exists():
+                self._import_legacy()
+            return
+
+        try:
+            with open(self.history_file) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    self._file_lines += 1
+                    try:
+                        self._push_record(loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            self._reset()
+
+    def _import_legacy(self):
+        """Move history from the old JSON list file into the JSONL file."""
+        try:
+            records = loads(self.legacy_file.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if isinstance(records, list):
+            for h in records:
+                self._push_record(h)
+
+        try:
+            self._compact()
+            self.legacy_file.unlink()
+        except OSError:
+            pass
+
+    def _push_record(self, h):
+        """Push a stored record, skipping anything that isn't a message."""
+        if isinstance(h, dict) and "role" in h and "content" in h:
+            self._push(h["role"], h["content"], h.get("timestamp", ""))
+
+    def _reset(self):
+        """Drop all in-memory messages."""
+        self._roles = []
+        self._contents = []
+        self._timestamps = []
+        self._file_lines = 0
+
+    def _push(self, role: str, content: str, timestamp: str):
+        """Append one message in memory, keeping at most max_history."""
+        self._roles.append(role)
+        self._contents.append(content)
+        self._timestamps.append(timestamp)
+
+        if len(self._roles) > self.max_history:
+            del self._roles[0]
+            del self._contents[0]
+            del self._timestamps[0]
+
+    def _records(self, start: int = 0) -> List[Dict]:
+        """Materialize messages from `start` onwards as dicts."""
+        return [
+            {"role": r, "content": c, "timestamp": t}
+            for r, c, t in zip(
+                self._roles[start:], self._contents[start:], self._timestamps[start:]
+            )
+        ]
+
+    def flush(self):
+        """Append buffered messages to the history file."""
+        if not self._pending:
+            return
+
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, "a") as f:
+            f.write("".join(dumps(h, indent=False) + "\n" for h in self._pending))
+        self._file_lines += len(self._pending)
+        self._pending = []
+
+        # Keep the file bounded: rewrite with only the retained messages
+        if self._file_lines > 4 * self.max_history:
+            self._compact()
+
+    def close(self):
+        """Flush pending messages; call when the session ends."""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def _compact(self):
+        """Rewrite the history file with only the retained messages."""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         self.history_file.write_text(
-            json.dumps(self._history[-self.max_history :], indent=2)
+            "".join(dumps(h, indent=False) + "\n" for h in self._records())
         )
+        self._file_lines = len(self._roles)
+        self._pending = []
 
     def add(self, role: str, content: str):
         """Add a message to history."""
-        self._history.append(
-            {"role": role, "content": content, "timestamp": datetime.now().isoformat()}
+        timestamp = datetime.now().isoformat()
+        self._push(role, content, timestamp)
+        self._pending.append(
+            {"role": role, "content": content, "timestamp": timestamp}
         )
-        self._save()
+        if len(self._pending) >= self.FLUSH_EVERY:
+            self.flush()
 
     def get_messages(self, include_system: bool = False) -> List[Dict]:
         """Get messages in ollama format."""
@@ -56,22 +155,25 @@ class ConversationManager:
                 }
             )
 
-        for h in self._history:
-            messages.append({"role": h["role"], "content": h["content"]})
+        messages.extend(
+            {"role": r, "content": c} for r, c in zip(self._roles, self._contents)
+        )
 
         return messages
 
     def clear(self):
         """Clear conversation history."""
-        self._history = []
-        self._save()
+        self._reset()
+        self._compact()
 
     def get_last_n(self, n: int) -> List[Dict]:
         """Get last n messages."""
-        return self._history[-n:] if self._history else []
+        if not self._roles:
+            return []
+        return self._records(max(len(self._roles) - n, 0) if n else 0)
 
     def __len__(self):
-        return len(self._history)
+        return len(self._roles)
 
     def __repr__(self):
-        return f"ConversationManager(messages={len(self._history)})"
+        return f"ConversationManager(messages={len(self._roles)})"
@@ -5,7 +5,10 @@ Model Downloader - Auto-download models via ollama pull
 import subprocess
 import sys
 import os
-from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List
+
+from .config import ModelInfo
 
 
 class ModelDownloader:
@@ -39,26 +42,24 @@ class ModelDownloader:
 
         return self._download(model, info)
 
-    def _download(self, model: str, info: Dict) -> bool:
+    def _download(self, model: str, info: ModelInfo) -> bool:
         """Download a model with progress."""
-        size_mb = info["size_mb"]
+        size_mb = info.size_mb
 
         print(f"📥 Auto-downloading {model} (~{size_mb}MB)...")
 
+        # Let ollama write its progress straight to our stderr fd instead of
+        # relaying it line by line through Python
         try:
-            process = subprocess.Popen(
-                ["ollama", "pull", model],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-            )
-
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    print(f"  {line}", file=sys.stderr)
+            progress_fd = sys.stderr.fileno()
+        except (AttributeError, OSError):
+            progress_fd = None
 
-            process.wait()
+        try:
+            sys.stdout.flush()
+            process = subprocess.run(
+                ["ollama", "pull", model], stdout=progress_fd, stderr=progress_fd
+            )
 
             if process.returncode == 0:
                 print(f"✅ Downloaded {model}")
@@ -89,12 +90,14 @@ class ModelDownloader:
         return None
 
     def download_voters(self, count: int = 3) -> List[str]:
-        """Download voter models if needed."""
+        """Download voter models if needed (pulls run concurrently)."""
         from .config import VOTER_MODELS
 
-        downloaded = []
-        for model in VOTER_MODELS[:count]:
-            if self.ensure_available(model):
-                downloaded.append(model)
+        models = VOTER_MODELS[:count]
+        if not models:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(3, len(models))) as executor:
+            results = list(executor.map(self.ensure_available, models))
 
-        return downloaded
+        return [model for model, ok in zip(models, results) if ok]
@@ -4,22 +4,45 @@ Hardware Detection - Detect system capabilities and select profile
 
 import psutil
 import shutil
-from typing import Dict
+import time
+from functools import cached_property
+from typing import Dict, Optional, Tuple
+
+# Handle both package and direct imports
+try:
+    from .config import HARDWARE_PROFILES, ModelInfo
+except ImportError:
+    from config import HARDWARE_PROFILES, ModelInfo
+
+# Seconds a hardware snapshot stays valid; shared by all detectors so one
+# CLI invocation does a single meminfo/statvfs read.
+HW_CACHE_TTL = 1.0
+
+_hw_cache: Tuple[float, Optional[Dict]] = (0.0, None)
 
 
 class HardwareDetector:
     def detect(self) -> Dict:
-        """Detect system capabilities."""
+        """Detect system capabilities (cached for HW_CACHE_TTL seconds)."""
+        global _hw_cache
+
+        now = time.monotonic()
+        ts, cached = _hw_cache
+        if cached is not None and now - ts < HW_CACHE_TTL:
+            return cached
+
         ram = psutil.virtual_memory()
         disk = shutil.disk_usage("/")
 
-        return {
+        hw = {
             "total_ram_gb": ram.total / (1024**3),
             "available_ram_gb": ram.available / (1024**3),
             "free_disk_gb": disk.free / (1024**3),
             "cpu_cores": psutil.cpu_count(),
             "max_parallel_models": self._estimate_parallel_capacity(ram.available),
         }
+        _hw_cache = (now, hw)
+        return hw
 
     def _estimate_parallel_capacity(self, available_bytes: int) -> int:
         """Estimate how many models can run in parallel."""
@@ -31,10 +54,15 @@ class HardwareDetector:
         else:
             return 1
 
-    def get_profile(self) -> str:
-        """Select hardware profile based on RAM."""
-        hw = self.detect()
-        ram = hw["total_ram_gb"]
+    @cached_property
+    def _hw(self) -> Dict:
+        """Snapshot used for profile decisions (total RAM doesn't change)."""
+        return self.detect()
+
+    @cached_property
+    def profile_name(self) -> str:
+        """Hardware profile name based on total RAM."""
+        ram = self._hw["total_ram_gb"]
 
         if ram < 6:
             return "minimal"
@@ -45,21 +73,24 @@ class HardwareDetector:
         else:
             return "powerful"
 
-    def can_fit_model(self, model_info: Dict) -> bool:
+    @cached_property
+    def profile(self) -> Dict:
+        """HARDWARE_PROFILES entry for this machine."""
+        return HARDWARE_PROFILES.get(self.profile_name, {})
+
+    def get_profile(self) -> str:
+        """Select hardware profile based on RAM."""
+        return self.profile_name
+
+    def can_fit_model(self, model_info: ModelInfo) -> bool:
         """Check if model fits in available RAM."""
-        available = psutil.virtual_memory().available / (1024 * 1024)
-        return model_info["ram_mb"] < available * 0.7
+        available = self.detect()["available_ram_gb"] * 1024
+        return model_info.ram_mb < available * 0.7
 
     def get_max_tier(self) -> int:
         """Get max model tier for current hardware."""
-        from .config import HARDWARE_PROFILES
-
-        profile = HARDWARE_PROFILES.get(self.get_profile(), {})
-        return profile.get("max_model_tier", 1)
+        return self.profile.get("max_model_tier", 1)
 
     def allow_parallel(self) -> bool:
         """Check if parallel execution is allowed."""
-        from .config import HARDWARE_PROFILES
-
-        profile = HARDWARE_PROFILES.get(self.get_profile(), {})
-        return profile.get("allow_parallel", False)
+        return self.profile.get("allow_parallel", False)
@@ -2,63 +2,108 @@
 Intent classification - distinguish tasks from chat.
 """
 
+import re
+from functools import lru_cache
 from typing import Literal
 
-ACTION_VERBS = [
-    "create",
-    "make",
-    "build",
-    "write",
-    "generate",
-    "implement",
-    "fix",
-    "debug",
-    "refactor",
-    "optimize",
-    "delete",
-    "remove",
-    "add",
-    "update",
-    "modify",
-    "change",
-    "convert",
-    "transform",
-    "develop",
-    "code",
-    "program",
-    "script",
-    "design",
-    "construct",
-    "edit",
-    "patch",
-    "solve",
-    "automate",
-    "deploy",
-    "set up",
-]
-
-QUESTION_STARTERS = [
-    "what",
-    "how",
-    "why",
-    "when",
-    "where",
-    "who",
-    "which",
-    "can you",
-    "could you",
-    "would you",
-    "explain",
-    "tell me",
-    "describe",
-    "help me understand",
-    "what's",
-    "what is",
-    "is there",
-    "are there",
-    "do you",
-    "does",
-]
+ACTION_VERBS = frozenset(
+    [
+        "create",
+        "make",
+        "build",
+        "write",
+        "generate",
+        "implement",
+        "fix",
+        "debug",
+        "refactor",
+        "optimize",
+        "delete",
+        "remove",
+        "add",
+        "update",
+        "modify",
+        "change",
+        "convert",
+        "transform",
+        "develop",
+        "code",
+        "program",
+        "script",
+        "design",
+        "construct",
+        "edit",
+        "patch",
+        "solve",
+        "automate",
+        "deploy",
+        "set up",
+    ]
+)
+
+QUESTION_STARTERS = frozenset(
+    [
+        "what",
+        "how",
+        "why",
+        "when",
+        "where",
+        "who",
+        "which",
+        "can you",
+        "could you",
+        "would you",
+        "explain",
+        "tell me",
+        "describe",
+        "help me understand",
+        "what's",
+        "what is",
+        "is there",
+        "are there",
+        "do you",
+        "does",
+    ]
+)
+
+GREETINGS = frozenset(
+    [
+        "hello",
+        "hi",
+        "hey",
+        "good morning",
+        "good afternoon",
+        "thanks",
+        "thank you",
+    ]
+)
+
+CODE_PATTERNS = frozenset(
+    [
+        "function that",
+        "script that",
+        "program that",
+        "code that",
+        "class that",
+        "module that",
+        "api that",
+    ]
+)
+
+
+def _alternation(words) -> str:
+    """Regex alternation of literal words, longest first."""
+    ordered = sorted(words, key=lambda w: (-len(w), w))
+    return "|".join(map(re.escape, ordered))
+
+
+# Compiled once so each check is a single scan over the input. Verbs count
+# as a prefix of the input ("building ...") or anywhere when followed by a
+# space; question starters are plain prefixes.
+_ACTION_RE = re.compile(r"^(?:{0})|(?:{0}) ".format(_alternation(ACTION_VERBS)))
+_QUESTION_RE = re.compile(r"^(?:" + _alternation(QUESTION_STARTERS) + r")")
+_GREETING_RE = re.compile(r"^(?:" + _alternation(GREETINGS) + r")(?: |\Z)")
+_CODE_PATTERN_RE = re.compile(_alternation(CODE_PATTERNS))
 
 
 def classify_intent(input_text: str) -> Literal["task", "chat"]:
@@ -76,47 +121,27 @@ def classify_intent(input_text: str) -> Literal["task", "chat"]:
     Returns:
         "task" or "chat"
     """
-    input_lower = input_text.lower().strip()
+    return _classify_lower(input_text.lower().strip())
+
 
+@lru_cache(maxsize=2048)
+def _classify_lower(input_lower: str) -> Literal["task", "chat"]:
+    """Rule-based classification of normalized input (cached)."""
     # Check for action verbs (task indicators)
-    for verb in ACTION_VERBS:
-        if f"{verb} " in input_lower:
-            return "task"
-        if input_lower.startswith(verb):
-            return "task"
+    if _ACTION_RE.search(input_lower):
+        return "task"
 
     # Check for question patterns (chat indicators)
-    for starter in QUESTION_STARTERS:
-        if input_lower.startswith(starter):
-            return "chat"
+    if _QUESTION_RE.match(input_lower):
+        return "chat"
 
     # Check for greetings and simple phrases
-    greetings = [
-        "hello",
-        "hi",
-        "hey",
-        "good morning",
-        "good afternoon",
-        "thanks",
-        "thank you",
-    ]
-    for greeting in greetings:
-        if input_lower == greeting or input_lower.startswith(f"{greeting} "):
-            return "chat"
+    if _GREETING_RE.match(input_lower):
+        return "chat"
 
     # Check if it's a code request pattern
-    code_patterns = [
-        "function that",
-        "script that",
-        "program that",
-        "code that",
-        "class that",
-        "module that",
-        "api that",
-    ]
-    for pattern in code_patterns:
-        if pattern in input_lower:
-            return "task"
+    if _CODE_PATTERN_RE.search(input_lower):
+        return "task"
 
     # Default to chat
     return "chat"
@@ -0,0 +1,34 @@
+"""
+JSON helpers - use orjson when installed, stdlib json otherwise.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+        """Serialize to UTF-8 bytes (2-space indent unless indent=False)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps_bytes(obj: Any, indent: bool = True) -> bytes:
+        """Serialize to UTF-8 bytes (2-space indent unless indent=False)."""
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to str (2-space indent unless indent=False)."""
+    return dumps_bytes(obj, indent).decode()
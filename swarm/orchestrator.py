@@ -2,16 +2,45 @@
 Swarm Orchestrator - Main coordinator for multi-model collaboration
 """
 
+import hashlib
 import ollama
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
+import re
+import selectors
+import signal
 import subprocess
+import sys
 import tempfile
+import threading
+import time
+import traceback
 import os
 
+from .config import TASK_REQUIREMENTS
 from .intent import classify_intent
 from .conversation import ConversationManager
 
+# First fenced block; an unclosed fence (output cut off) runs to the end
+_FENCE_RE = re.compile(r"```(?:python)?\s*\n?(.*?)(?:```|\Z)", re.S)
+
+# Seconds a generated skill may run under test
+TEST_TIMEOUT = 15
+
+_ollama_ok = False
+
+
+def _ollama_alive() -> bool:
+    """Cheap check that the Ollama daemon answers (success is cached)."""
+    global _ollama_ok
+    if not _ollama_ok:
+        try:
+            ollama.list()
+            _ollama_ok = True
+        except Exception:
+            pass
+    return _ollama_ok
+
 
 class SwarmOrchestrator:
     MAX_ITERATIONS = 12
@@ -36,6 +65,7 @@ class SwarmOrchestrator:
         self.voter = voter
         self.analyzer = analyzer
         self.conversation = ConversationManager()
+        self._vote_cache: Dict[bytes, Dict] = {}
 
     def run(self, goal: str, offline: bool = False, force_mode: str = None) -> Dict:
         """
@@ -55,6 +85,15 @@ class SwarmOrchestrator:
         else:
             intent = classify_intent(goal)
 
+        # Fail fast instead of waiting on timeouts in every model call
+        if not _ollama_alive():
+            return {
+                "success": False,
+                "error": "Ollama is not running (start it with: ollama serve)",
+                "iterations": 0,
+                "type": intent,
+            }
+
         if intent == "chat":
             return self._chat(goal, offline)
 
@@ -95,17 +134,24 @@ class SwarmOrchestrator:
         messages = self.conversation.get_messages(include_system=True)
 
         try:
-            response = ollama.chat(
-                model=model, messages=messages, options={"temperature": 0.7}
-            )
-
-            answer = response["message"]["content"]
+            # Stream so the answer starts appearing after the first token
+            parts = []
+            for chunk in ollama.chat(
+                model=model,
+                messages=messages,
+                options={"temperature": 0.7},
+                stream=True,
+            ):
+                piece = chunk["message"]["content"]
+                parts.append(piece)
+                print(piece, end="", flush=True)
+            print()
+
+            answer = "".join(parts)
 
             # Add assistant response to history
             self.conversation.add("assistant", answer)
 
-            print(answer)
-
             return {
                 "success": True,
                 "type": "chat",
@@ -127,6 +173,8 @@ class SwarmOrchestrator:
         iteration = 0
         history = []
         skill_code = ""
+        # Vote results are only reused within a single run
+        self._vote_cache.clear()
 
         while iteration < self.MAX_ITERATIONS:
             iteration += 1
@@ -145,27 +193,14 @@ class SwarmOrchestrator:
                         "iterations": iteration,
                     }
 
-            decision = self._vote_on_action(goal, iteration, history, skill_code)
-
-            action = decision["action"]
-            confidence = decision["confidence"]
-
-            # Forced workflow for better reliability
-            if not history:
-                action = "plan_skill"
-            elif len(history) == 1 and history[0]["action"] == "plan_skill":
-                if skill_code:
-                    action = "write_skill"
-                else:
-                    action = "plan_skill"
-            elif len(history) >= 2:
-                last = history[-1]
-                if last["action"] == "write_skill" and last.get("result", {}).get(
-                    "success"
-                ):
-                    action = "test_skill"
-                elif last["action"] == "plan_skill" and skill_code:
-                    action = "write_skill"
+            # Only vote when the forced workflow leaves the choice open
+            action = self._forced_next_action(history, skill_code)
+            if action is None:
+                decision = self._vote_on_action(goal, iteration, history, skill_code)
+                action = decision["action"]
+                confidence = decision["confidence"]
+            else:
+                confidence = 1.0
 
             print(f"  Action: {action} (confidence: {confidence:.0%})")
 
@@ -181,7 +216,9 @@ class SwarmOrchestrator:
                     "iterations": iteration,
                 }
 
-            result = self._execute_action(action, goal, coder_model, skill_code)
+            result = self._execute_action(
+                action, goal, coder_model, skill_code, task_info.get("complexity")
+            )
             history.append({"action": action, "result": result})
 
             if result.get("success"):
@@ -204,6 +241,30 @@ class SwarmOrchestrator:
             "iterations": iteration,
         }
 
+    def _forced_next_action(self, history: list, skill_code: str) -> Optional[str]:
+        """
+        Forced workflow for better reliability.
+
+        Returns the next action when history and code determine it, or None
+        when the voters should decide.
+        """
+        if not history:
+            return "plan_skill"
+
+        if len(history) == 1 and history[0]["action"] == "plan_skill":
+            return "write_skill" if skill_code else "plan_skill"
+
+        if len(history) >= 2:
+            last = history[-1]
+            if last["action"] == "write_skill" and last.get("result", {}).get(
+                "success"
+            ):
+                return "test_skill"
+            if last["action"] == "plan_skill" and skill_code:
+                return "write_skill"
+
+        return None
+
     def _vote_on_action(
         self, goal: str, iteration: int, history: list, skill_code: str
     ) -> Dict:
@@ -244,15 +305,29 @@ Reply with ONE action:
 
 Action:"""
 
-        return self.voter.vote(prompt)
+        # Key on the state the voters see, not the iteration counter, so a
+        # retry that lands back in the same state reuses the earlier vote
+        key = hashlib.blake2b(
+            f"{goal}\0{history_text}\0{has_code}".encode(), digest_size=16
+        ).digest()
+        decision = self._vote_cache.get(key)
+        if decision is None:
+            decision = self.voter.vote(prompt)
+            self._vote_cache[key] = decision
+        return decision
 
     def _execute_action(
-        self, action: str, goal: str, coder_model: str, skill_code: str
+        self,
+        action: str,
+        goal: str,
+        coder_model: str,
+        skill_code: str,
+        complexity: str = "medium",
     ) -> Dict:
         """Execute an action using appropriate model."""
 
         if action == "plan_skill":
-            return self._plan(goal, coder_model)
+            return self._plan(goal, coder_model, complexity)
 
         elif action == "write_skill":
             return self._write(skill_code)
@@ -263,8 +338,12 @@ Action:"""
         else:
             return {"success": False, "message": f"Unknown action: {action}"}
 
-    def _plan(self, goal: str, model: str) -> Dict:
+    def _plan(self, goal: str, model: str, complexity: str = "medium") -> Dict:
         """Generate code for the goal."""
+        num_predict = TASK_REQUIREMENTS["code_generation"].num_predict.get(
+            complexity, 1000
+        )
+
         prompt = f"""Write Python code for this task. Output ONLY the code.
 
 Task: {goal}
@@ -276,20 +355,23 @@ CRITICAL RULES:
 
 Code:"""
 
-        response = ollama.chat(
+        # Stop reading (and generating) once the code fence has closed;
+        # anything after it is prose we would strip anyway
+        code = ""
+        for chunk in ollama.chat(
             model=model,
             messages=[{"role": "user", "content": prompt}],
-            options={"temperature": 0.7, "num_predict": 1000},
-        )
-
-        code = response["message"]["content"]
+            options={"temperature": 0.2, "num_predict": num_predict},
+            stream=True,
+        ):
+            piece = chunk["message"]["content"]
+            code += piece
+            if "`" in piece and code.count("```") >= 2:
+                break
 
-        if "```" in code:
-            parts = code.split("```")
-            if len(parts) > 1:
-                code = parts[1]
-                if code.startswith("python"):
-                    code = code[6:]
+        m = _FENCE_RE.search(code)
+        if m:
+            code = m.group(1)
 
         return {
             "success": True,
@@ -315,30 +397,164 @@ Code:"""
         if not code:
             return {"success": False, "message": "No code to test"}
 
-        try:
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-                f.write(code)
-                temp_path = f.name
+        # Forking the already-running interpreter skips python3 startup
+        runner = self._run_forked if self._can_fork() else self._run_subprocess
 
-            result = subprocess.run(
-                ["python3", temp_path], capture_output=True, text=True, timeout=15
-            )
-
-            os.unlink(temp_path)
+        try:
+            returncode, stdout, stderr = runner(code, TEST_TIMEOUT)
 
-            if result.returncode == 0:
+            if returncode == 0:
                 return {
                     "success": True,
                     "message": f"Test passed",
-                    "output": result.stdout[:500],
+                    "output": stdout[:500],
                 }
             else:
                 return {
                     "success": False,
-                    "message": f"Test failed: {result.stderr[:200]}",
+                    "message": f"Test failed: {stderr[:200]}",
                 }
 
         except subprocess.TimeoutExpired:
             return {"success": False, "message": "Test timed out"}
         except Exception as e:
             return {"success": False, "message": f"Test error: {e}"}
+
+    def _can_fork(self) -> bool:
+        """
+        Whether _test may run skills in a forked child of this process.
+
+        Components that keep worker threads stop them in an
+        os.register_at_fork(before=...) hook (see SwarmVoter), so the fork
+        happens while this process is single-threaded.
+        """
+        return hasattr(os, "fork")
+
+    def _run_subprocess(self, code: str, timeout: float) -> Tuple[int, str, str]:
+        """Run code in a fresh python3 process."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(code)
+            temp_path = f.name
+
+        try:
+            result = subprocess.run(
+                ["python3", temp_path], capture_output=True, text=True, timeout=timeout
+            )
+        finally:
+            os.unlink(temp_path)
+
+        return result.returncode, result.stdout, result.stderr
+
+    def _run_forked(self, code: str, timeout: float) -> Tuple[int, str, str]:
+        """Run code in a forked child of this interpreter (POSIX only)."""
+        try:
+            compiled = compile(code, "<skill>", "exec")
+        except SyntaxError:
+            return 1, "", traceback.format_exc(limit=0)
+
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            _exec_child(compiled, out_w, err_w, (out_r, err_r), timeout)
+
+        os.close(out_w)
+        os.close(err_w)
+
+        chunks = {out_r: [], err_r: []}
+        deadline = time.monotonic() + timeout
+        sel = selectors.DefaultSelector()
+        for fd in chunks:
+            sel.register(fd, selectors.EVENT_READ)
+
+        try:
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired("<skill>", timeout)
+
+                for key, _ in sel.select(remaining):
+                    data = os.read(key.fd, 65536)
+                    if data:
+                        chunks[key.fd].append(data)
+                    else:
+                        sel.unregister(key.fd)
+        except BaseException:
+            # Like subprocess.run: never leave the child running
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise
+        finally:
+            sel.close()
+            os.close(out_r)
+            os.close(err_r)
+
+        _, status = os.waitpid(pid, 0)
+        returncode = os.waitstatus_to_exitcode(status)
+        stdout, stderr = (
+            b"".join(chunks[fd]).decode(errors="replace") for fd in (out_r, err_r)
+        )
+        return returncode, stdout, stderr
+
+
+def _exec_child(compiled, out_w: int, err_w: int, close_fds, timeout: float):
+    """Forked child: run compiled skill code with pipes as stdout/stderr."""
+    import resource  # POSIX-only, like os.fork
+
+    exit_code = 1
+    try:
+        for fd in close_fds:
+            os.close(fd)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        # The parent's sys streams may not be fds 0-2 (e.g. under pytest)
+        sys.stdin = open(0, closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+
+        # CPU backstop in case the parent dies before enforcing the timeout
+        limit = int(timeout) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, limit))
+        sys.argv = ["<skill>"]
+
+        try:
+            exec(compiled, {"__name__": "__main__", "__file__": "<skill>"})
+            exit_code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            # Drop this frame so the report starts at the skill's own code
+            etype, value, tb = sys.exc_info()
+            traceback.print_exception(etype, value, tb.tb_next)
+
+        _join_threads()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def _join_threads():
+    """Wait for non-daemon threads the skill started, as interpreter exit does."""
+    # Only the forking thread survives fork(), so any other is the skill's
+    current = threading.current_thread()
+    while True:
+        alive = [
+            t
+            for t in threading.enumerate()
+            if t is not current and not t.daemon and t.is_alive()
+        ]
+        if not alive:
+            return
+        for t in alive:
+            t.join()
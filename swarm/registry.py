@@ -2,70 +2,100 @@
 Model Registry - Track which models are installed and their metadata
 """
 
-import subprocess
+import atexit
 import json
+import ollama
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Collection, List, Dict, Optional, Tuple
+
+from .jsonio import dumps_bytes, loads
 
 
 class ModelRegistry:
     REGISTRY_FILE = Path.home() / ".swarm" / "model_registry.json"
+    # Seconds an `ollama list` result is reused before asking again
+    INSTALLED_TTL = 5.0
 
     def __init__(self):
         self.REGISTRY_FILE.parent.mkdir(exist_ok=True)
         self._registry = self._load()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._installed_cache: Optional[Tuple[float, List[str]]] = None
+        atexit.register(self.flush)
 
     def _load(self) -> Dict:
         """Load registry from disk."""
         if self.REGISTRY_FILE.exists():
             try:
-                return json.loads(self.REGISTRY_FILE.read_text())
+                return loads(self.REGISTRY_FILE.read_bytes())
             except json.JSONDecodeError:
                 pass
         return {"installed": {}, "downloaded_by_swarm": [], "usage": {}}
 
     def _save(self):
-        """Save registry to disk."""
-        self.REGISTRY_FILE.write_text(json.dumps(self._registry, indent=2))
+        """Mark registry as changed; written out by flush()."""
+        self._dirty = True
+
+    def flush(self):
+        """Write pending registry changes to disk."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self.REGISTRY_FILE.write_bytes(dumps_bytes(self._registry, indent=False))
+            self._dirty = False
 
     def get_installed_models(self) -> List[str]:
-        """Get list of installed ollama models."""
+        """Get list of installed ollama models (cached for INSTALLED_TTL)."""
+        now = time.monotonic()
+        if self._installed_cache is not None:
+            ts, models = self._installed_cache
+            if now - ts < self.INSTALLED_TTL:
+                return models
+
+        models = self._list_installed()
+        self._installed_cache = (now, models)
+        return models
+
+    def invalidate_installed(self):
+        """Forget the cached model list (after a pull or removal)."""
+        self._installed_cache = None
+
+    def _list_installed(self) -> List[str]:
+        """Query ollama for installed models."""
         try:
-            result = subprocess.run(
-                ["ollama", "list"], capture_output=True, text=True, timeout=10
-            )
-
-            if result.returncode != 0:
-                return []
-
-            models = []
-            for line in result.stdout.strip().split("\n")[1:]:
-                if line.strip():
-                    model_name = line.split()[0]
-                    models.append(model_name)
-
-            return models
+            return [m.get("model") or m.get("name") for m in ollama.list()["models"]]
         except Exception:
             return []
 
     def is_installed(self, model: str) -> bool:
         """Check if a model is installed (handles model:tag format)."""
-        installed = self.get_installed_models()
+        installed = set(self.get_installed_models())
         # Direct match
         if model in installed:
             return True
         # Prefix match (model vs model:latest)
         model_base = model.split(":")[0]
-        for installed_model in installed:
-            installed_base = installed_model.split(":")[0]
-            if model_base == installed_base:
-                return True
-        return False
+        return any(m.split(":")[0] == model_base for m in installed)
 
     def mark_downloaded_by_swarm(self, model: str):
         """Mark a model as downloaded by swarm (for cleanup)."""
-        if model not in self._registry["downloaded_by_swarm"]:
-            self._registry["downloaded_by_swarm"].append(model)
+        self.invalidate_installed()
+        with self._lock:
+            if model not in self._registry["downloaded_by_swarm"]:
+                self._registry["downloaded_by_swarm"].append(model)
+                self._save()
+
+    def forget_swarm_downloads(self, models: Collection[str]):
+        """Drop removed models from the swarm-downloaded list in one pass."""
+        if not models:
+            return
+        with self._lock:
+            self._registry["downloaded_by_swarm"] = [
+                m for m in self._registry["downloaded_by_swarm"] if m not in models
+            ]
             self._save()
 
     def is_swarm_downloaded(self, model: str) -> bool:
@@ -84,7 +114,7 @@ class ModelRegistry:
         """Get usage count for a model."""
         return self._registry.get("usage", {}).get(model, 0)
 
-    def get_least_used(self, exclude: List[str] = None) -> Optional[str]:
+    def get_least_used(self, exclude: Collection[str] = None) -> Optional[str]:
         """Get least-used swarm-downloaded model."""
         exclude = exclude or []
         swarm_models = self._registry.get("downloaded_by_swarm", [])
@@ -2,21 +2,41 @@
 Model Selector - Select best model for task (smallest that can do the job)
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 from .config import (
     MODEL_CATALOG,
     TASK_REQUIREMENTS,
+    TaskReq,
+    capability_mask,
     DEFAULT_CODER_MODEL,
     DEFAULT_ROUTER_MODEL,
 )
 
 
+# The catalog is static, so sort it by size once at import
+_BY_SIZE = sorted(MODEL_CATALOG.items(), key=lambda kv: kv[1].size_mb)
+
+
+@lru_cache(maxsize=128)
+def _candidates(min_tier: int, required: int, max_tier: int) -> Tuple[str, ...]:
+    """Catalog models within the tier range having all `required` bits."""
+    return tuple(
+        model
+        for model, info in _BY_SIZE
+        if min_tier <= info.tier <= max_tier and (info.cap_mask & required) == required
+    )
+
+
 class ModelSelector:
     def __init__(self, config, registry, downloader, hardware):
         self.config = config
         self.registry = registry
         self.downloader = downloader
         self.hardware = hardware
+        # Fit checks memoized within one select_for_task call; available RAM
+        # changes over a session, so the cache is not kept across calls
+        self._fit_cache: Dict[str, bool] = {}
 
     def select_for_task(
         self, task_type: str, complexity: str = "medium", offline: bool = False
@@ -29,29 +49,28 @@ class ModelSelector:
         2. Download smallest that meets requirements (if not offline)
         3. Fall back to best available
         """
-        requirements = TASK_REQUIREMENTS.get(task_type, {})
-        min_tier = requirements.get("min_tier", 0)
-        min_caps = requirements.get("min_capabilities", [])
+        requirements = TASK_REQUIREMENTS.get(task_type, TaskReq())
+        min_tier = requirements.min_tier
+        min_caps = requirements.min_capabilities
 
-        if complexity in requirements.get("complexity_upgrade", {}):
-            min_tier = requirements["complexity_upgrade"][complexity]
+        if complexity in requirements.complexity_upgrade:
+            min_tier = requirements.complexity_upgrade[complexity]
 
         max_tier = min(self.hardware.get_max_tier(), 2)
 
         candidates = self._get_candidates(min_tier, min_caps, max_tier)
+        self._fit_cache.clear()
 
         installed = self.registry.get_installed_models()
         for model in candidates:
             if model in installed:
-                info = MODEL_CATALOG.get(model, {})
-                if self.hardware.can_fit_model(info):
+                if self._fits(model):
                     self.registry.record_usage(model)
                     return model
 
         if not offline:
             for model in candidates:
-                info = MODEL_CATALOG.get(model, {})
-                if self.hardware.can_fit_model(info):
+                if self._fits(model):
                     if self.downloader.ensure_available(model):
                         self.registry.record_usage(model)
                         return model
@@ -62,25 +81,19 @@ class ModelSelector:
 
         return DEFAULT_ROUTER_MODEL
 
+    def _fits(self, model: str) -> bool:
+        """Whether a catalog model fits this machine (cached per selection)."""
+        fits = self._fit_cache.get(model)
+        if fits is None:
+            fits = self.hardware.can_fit_model(MODEL_CATALOG[model])
+            self._fit_cache[model] = fits
+        return fits
+
     def _get_candidates(
-        self, min_tier: int, min_caps: List[str], max_tier: int
-    ) -> List[str]:
+        self, min_tier: int, min_caps: Iterable[str], max_tier: int
+    ) -> Tuple[str, ...]:
         """Get candidate models sorted by size (smallest first)."""
-        candidates = []
-
-        for model, info in MODEL_CATALOG.items():
-            tier = info.get("tier", 99)
-            if tier < min_tier or tier > max_tier:
-                continue
-
-            model_caps = info.get("capabilities", [])
-            if not all(cap in model_caps for cap in min_caps):
-                continue
-
-            candidates.append((model, info["size_mb"]))
-
-        candidates.sort(key=lambda x: x[1])
-        return [model for model, _ in candidates]
+        return _candidates(min_tier, capability_mask(min_caps), max_tier)
 
     def select_coder(self, complexity: str = "medium", offline: bool = False) -> str:
         """Select model for code generation."""
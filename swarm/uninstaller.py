@@ -2,7 +2,7 @@
 Model Uninstaller - Remove unused models to free space
 """
 
-import subprocess
+import ollama
 import shutil
 from typing import List
 
@@ -22,8 +22,8 @@ class ModelUninstaller:
         Returns:
             Number of models removed
         """
-        keep_models = keep_models or []
-        removed = 0
+        keep_models = set(keep_models or [])
+        removed = set()
 
         swarm_models = list(self.registry._registry.get("downloaded_by_swarm", []))
 
@@ -33,11 +33,11 @@ class ModelUninstaller:
 
             if self._should_remove(model):
                 if self._uninstall(model):
-                    self.registry._registry["downloaded_by_swarm"].remove(model)
-                    self.registry._save()
-                    removed += 1
+                    removed.add(model)
 
-        return removed
+        self.registry.forget_swarm_downloads(removed)
+
+        return len(removed)
 
     def _should_remove(self, model: str) -> bool:
         """Check if model should be removed."""
@@ -45,29 +45,25 @@ class ModelUninstaller:
         if not info:
             return True
 
-        if info.get("always_keep", False):
+        if info.always_keep:
             return False
 
         usage = self.registry.get_usage_count(model)
         return usage < 3
 
     def _uninstall(self, model: str) -> bool:
-        """Uninstall a model via ollama rm."""
+        """Uninstall a model via the ollama API."""
         print(f"🗑️ Removing unused model: {model}")
 
         try:
-            result = subprocess.run(
-                ["ollama", "rm", model], capture_output=True, text=True, timeout=30
-            )
-
-            if result.returncode == 0:
-                print(f"✅ Removed {model}")
-                return True
-            else:
-                return False
+            ollama.delete(model)
         except Exception:
             return False
 
+        self.registry.invalidate_installed()
+        print(f"✅ Removed {model}")
+        return True
+
     def free_space_for(self, required_mb: int) -> bool:
         """
         Free enough space for a new model.
@@ -75,21 +71,39 @@ class ModelUninstaller:
         Returns:
             True if enough space freed
         """
-        free_gb = shutil.disk_usage("/").free / (1024**3)
+        required_free_mb = required_mb + 500
+        free_mb = self._free_mb()
 
-        if free_gb * 1024 > required_mb + 500:
+        if free_mb > required_free_mb:
             return True
 
-        while free_gb * 1024 < required_mb + 500:
-            least_used = self.registry.get_least_used()
-            if not least_used:
-                return False
-
-            if not self._uninstall(least_used):
-                return False
-
-            self.registry._registry["downloaded_by_swarm"].remove(least_used)
-            self.registry._save()
-            free_gb = shutil.disk_usage("/").free / (1024**3)
+        # Track freed space from catalog sizes instead of re-querying the disk
+        # after every removal; the disk is only checked to confirm
+        removed = set()
+        try:
+            while free_mb < required_free_mb:
+                least_used = self.registry.get_least_used(exclude=removed)
+                if not least_used:
+                    return False
+
+                if not self._uninstall(least_used):
+                    return False
+
+                removed.add(least_used)
+                info = self.config.MODEL_CATALOG.get(least_used)
+                if info is None:
+                    # Unknown size: measure rather than count it as nothing
+                    free_mb = self._free_mb()
+                else:
+                    free_mb += info.size_mb
+                    if free_mb >= required_free_mb:
+                        # Tags sharing blobs free less than their size
+                        free_mb = self._free_mb()
+        finally:
+            self.registry.forget_swarm_downloads(removed)
 
         return True
+
+    def _free_mb(self) -> float:
+        """Free disk space in MB."""
+        return shutil.disk_usage("/").free / (1024**2)
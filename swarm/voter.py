@@ -2,17 +2,68 @@
 Swarm Voter - Parallel voting with multiple tiny models
 """
 
+import atexit
 import ollama
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 from collections import Counter
 import re
 
+ACTIONS = (
+    "plan_skill",
+    "write_skill",
+    "test_skill",
+    "analyze_results",
+    "complete",
+    "failed",
+    "direct_answer",
+    "retry_plan",
+)
+
+# Matches "plan_skill" or "Plan Skill" etc. in a single scan; case-insensitive
+# so responses don't need lowercasing first. Word boundaries keep
+# "incomplete" from counting as "complete".
+_ACTION_RE = re.compile(
+    r"\b(?:" + "|".join(a.replace("_", "[_ ]") for a in ACTIONS) + r")\b",
+    re.IGNORECASE,
+)
+# When a reply names several actions, the earliest in ACTIONS wins
+_ACTION_RANK = {a: i for i, a in enumerate(ACTIONS)}
+
 
 class SwarmVoter:
+    MAX_WORKERS = 8
+
     def __init__(self, config, selector):
         self.config = config
         self.selector = selector
+        # Reused across votes so threads aren't created per round
+        self._pool = self._new_pool()
+        atexit.register(self._shutdown)
+        # Forking while pool threads may hold locks can deadlock the child
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(before=self.release_threads)
+
+    def _new_pool(self) -> ThreadPoolExecutor:
+        """Executor for voter calls; threads are started on first submit."""
+        return ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="voter"
+        )
+
+    def _shutdown(self):
+        """Stop the pool at interpreter exit."""
+        self._pool.shutdown(cancel_futures=True)
+
+    def release_threads(self):
+        """
+        Stop the worker threads once in-flight calls finish.
+
+        Runs before every os.fork() in this process. The next vote starts
+        fresh threads.
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = self._new_pool()
 
     def vote(
         self, prompt: str, voter_models: List[str] = None, timeout: float = 10.0
@@ -20,6 +71,12 @@ class SwarmVoter:
         """
         Run parallel vote across multiple models.
 
+        All voter requests are in flight at once and the round ends as soon
+        as a majority agrees, so the slowest voter is usually not waited
+        for. Keep the voter count at or below the
+        server's OLLAMA_NUM_PARALLEL / OLLAMA_MAX_LOADED_MODELS to avoid
+        server-side queuing.
+
         Returns:
             {
                 "action": "plan_skill",
@@ -32,28 +89,33 @@ class SwarmVoter:
             voter_models = self.selector.select_voters(3)
 
         responses = []
+        counts = Counter()
+        majority = len(voter_models) // 2 + 1
+
+        futures = {
+            self._pool.submit(self._call_voter, model, prompt, timeout): model
+            for model in voter_models
+        }
 
         try:
-            with ThreadPoolExecutor(max_workers=len(voter_models)) as executor:
-                futures = {
-                    executor.submit(self._call_voter, model, prompt, timeout): model
-                    for model in voter_models
-                }
-
-                for future in as_completed(futures, timeout=timeout + 10):
-                    model = futures[future]
-                    try:
-                        result = future.result(timeout=timeout)
-                        responses.append(
-                            {
-                                "model": model,
-                                "response": result,
-                            }
-                        )
-                    except Exception as e:
-                        pass
+            for future in as_completed(futures, timeout=timeout + 10):
+                model = futures[future]
+                try:
+                    result = future.result(timeout=timeout)
+                except Exception:
+                    continue
+
+                responses.append({"model": model, "response": result})
+                counts[self._parse_action(result)] += 1
+
+                # Remaining votes can't change the outcome
+                if counts.most_common(1)[0][1] >= majority:
+                    break
         except TimeoutError:
             pass
+        finally:
+            for future in futures:
+                future.cancel()
 
         if not responses:
             action = self.quick_vote(prompt)
@@ -64,7 +126,7 @@ class SwarmVoter:
                 "responses": [],
             }
 
-        return self._tally_votes(responses)
+        return self._tally_votes(counts, responses)
 
     def _call_voter(self, model: str, prompt: str, timeout: float) -> str:
         """Call a single voter model."""
@@ -73,19 +135,15 @@ class SwarmVoter:
             messages=[{"role": "user", "content": prompt}],
             options={
                 "num_predict": 20,
-                "temperature": 0.3,
+                "temperature": 0.1,
             },
         )
         return response["message"]["content"]
 
-    def _tally_votes(self, responses: List[Dict]) -> Dict:
-        """Count votes and determine winner."""
-        actions = []
-        for r in responses:
-            action = self._parse_action(r["response"])
-            actions.append(action)
-
-        if not actions:
+    def _tally_votes(self, counts: Counter, responses: List[Dict]) -> Dict:
+        """Determine the winner from actions already parsed during the vote."""
+        total = sum(counts.values())
+        if not total:
             return {
                 "action": "plan_skill",
                 "confidence": 0.0,
@@ -93,35 +151,23 @@ class SwarmVoter:
                 "responses": responses,
             }
 
-        vote_counts = Counter(actions)
-        winner, count = vote_counts.most_common(1)[0]
-        confidence = count / len(actions)
+        winner, count = counts.most_common(1)[0]
+        confidence = count / total
 
         return {
             "action": winner,
             "confidence": confidence,
-            "votes": dict(vote_counts),
+            "votes": dict(counts),
             "responses": responses,
         }
 
     def _parse_action(self, response: str) -> str:
         """Extract action from voter response."""
-        response = response.lower().strip()
-
-        actions = [
-            "plan_skill",
-            "write_skill",
-            "test_skill",
-            "analyze_results",
-            "complete",
-            "failed",
-            "direct_answer",
-            "retry_plan",
-        ]
-
-        for action in actions:
-            if action.replace("_", " ") in response or action in response:
-                return action
+        found = {
+            m.group(0).lower().replace(" ", "_") for m in _ACTION_RE.finditer(response)
+        }
+        if found:
+            return min(found, key=_ACTION_RANK.__getitem__)
 
         return "plan_skill"
 
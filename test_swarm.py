@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Test suite for the swarm package.
+
+Tests response parsing and heuristics that must not change how the swarm
+decides. Requires the swarm dependencies (ollama, psutil) to be installed;
+no Ollama server is needed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_voter_parse_action():
+    """Test that voter replies map to the same action as before."""
+    print("\n" + "="*70)
+    print("TEST: Voter Action Parsing")
+    print("="*70)
+
+    from swarm.voter import SwarmVoter
+
+    voter = SwarmVoter(None, None)
+
+    # Test 1: Plain and spaced action names
+    assert voter._parse_action("write_skill") == "write_skill"
+    assert voter._parse_action("Action: Test Skill") == "test_skill"
+    print("✓ Parses underscored and spaced action names")
+
+    # Test 2: "incomplete" is not "complete"
+    assert voter._parse_action("The task is incomplete; test_skill") == "test_skill"
+    assert voter._parse_action("Not complete yet. write_skill") == "write_skill"
+    assert voter._parse_action("incomplete") == "plan_skill"
+    print("✓ Does not read 'incomplete' as complete")
+
+    # Test 3: Highest-priority action wins, not the leftmost
+    assert voter._parse_action("failed test, retry: plan_skill") == "plan_skill"
+    assert voter._parse_action("complete, then test_skill") == "test_skill"
+    print("✓ Keeps action priority order")
+
+    # Test 4: No action
+    assert voter._parse_action("I am not sure") == "plan_skill"
+    print("✓ Defaults to plan_skill")
+
+    # Test 5: Votes are tallied from the parsed replies
+    replies = {"a": "write_skill", "b": "Write Skill", "c": "test_skill"}
+    voter._call_voter = lambda model, prompt, timeout: replies[model]
+    result = voter.vote("next?", voter_models=["a", "b", "c"])
+    assert result["action"] == "write_skill"
+    assert result["votes"]["write_skill"] == 2
+    print("✓ Tallies votes")
+
+    print("\n✅ Voter Action Parsing: ALL TESTS PASSED")
+
+
+def _baseline_classify(input_text):
+    """The original loop-based classifier, kept as a reference."""
+    from swarm.intent import ACTION_VERBS, QUESTION_STARTERS, GREETINGS, CODE_PATTERNS
+
+    input_lower = input_text.lower().strip()
+    for verb in ACTION_VERBS:
+        if f"{verb} " in input_lower or input_lower.startswith(verb):
+            return "task"
+    for starter in QUESTION_STARTERS:
+        if input_lower.startswith(starter):
+            return "chat"
+    for greeting in GREETINGS:
+        if input_lower == greeting or input_lower.startswith(f"{greeting} "):
+            return "chat"
+    for pattern in CODE_PATTERNS:
+        if pattern in input_lower:
+            return "task"
+    return "chat"
+
+
+def test_classify_intent():
+    """Test that the compiled classifier matches the original rules."""
+    print("\n" + "="*70)
+    print("TEST: Intent Classification")
+    print("="*70)
+
+    from swarm.intent import classify_intent
+
+    corpus = [
+        "Building a web scraper in python",
+        "Creates a CSV parser",
+        "Refactoring the auth module",
+        "Implementing quicksort",
+        "fixing the login bug",
+        "create a fibonacci function",
+        "please write a script",
+        "can you fix this",
+        "What is a closure?",
+        "whatever you think",
+        "however, a function that parses dates",
+        "how do I set up docker",
+        "hello",
+        "hi there",
+        "history of rome",
+        "thanks!",
+        "barcode scanner",
+        "a function that sorts",
+        "api that returns json",
+        "tell me a joke",
+        "  Deploy the app  ",
+        "the weather today",
+        "",
+    ]
+    for text in corpus:
+        expected = _baseline_classify(text)
+        assert classify_intent(text) == expected, f"{text!r} should be {expected}"
+    print(f"✓ Matches the original rules on {len(corpus)} inputs")
+
+    assert classify_intent("Building a web scraper in python") == "task"
+    assert classify_intent("What is a closure?") == "chat"
+    print("✓ Classifies tasks and questions")
+
+    print("\n✅ Intent Classification: ALL TESTS PASSED")
+
+
+def test_analyzer_keywords():
+    """Test the keyword screen that can skip the analyzer model."""
+    print("\n" + "="*70)
+    print("TEST: Analyzer Keywords")
+    print("="*70)
+
+    from swarm.analyzer import TaskAnalyzer
+
+    analyzer = TaskAnalyzer({})
+
+    # Test 1: Keywords inside other words don't count
+    goal = "Write a function that returns the latest value"
+    assert analyzer._estimate_type(goal) == "code"
+    assert analyzer._estimate_complexity("create a rapid prototype") == "medium"
+    assert analyzer._estimate_complexity("fix the address parser") == "medium"
+    assert analyzer._screen("create a rapid prototype") is None
+    assert analyzer._screen("fix the address parser") is None
+    print("✓ Ignores keywords embedded in other words")
+
+    # Test 2: Whole words and inflections still count
+    assert analyzer._estimate_complexity("optimize the database") == "complex"
+    assert analyzer._estimate_complexity("Optimized databases") == "complex"
+    assert analyzer._estimate_complexity("add two numbers") == "simple"
+    assert analyzer._estimate_type("fixing bugs in the parser") == "debug"
+    assert analyzer._estimate_type("add pytest tests") == "test"
+    assert analyzer._estimate_complexity("optimizing a sort") == "complex"
+    assert analyzer._estimate_complexity("reduce the complexity") == "complex"
+    assert analyzer._estimate_complexity("an algorithmic puzzle") == "complex"
+    assert analyzer._estimate_type("writing a parser") == "code"
+    assert analyzer._estimate_type("creating a parser") == "code"
+    print("✓ Matches whole and inflected keywords")
+
+    # Test 3: Other words sharing a stem don't count
+    assert analyzer._estimate_complexity("restart systemd units") == "medium"
+    print("✓ Ignores longer words that aren't inflections")
+
+    # Test 4: Screen decides only when both heuristics agree
+    result = analyzer._screen("debug a simple script")
+    assert result["type"] == "debug" and result["complexity"] == "simple"
+    print("✓ Screens clear-cut goals")
+
+    print("\n✅ Analyzer Keywords: ALL TESTS PASSED")
+
+
+def test_analyzer_cache():
+    """Test that only real verdicts are cached."""
+    print("\n" + "="*70)
+    print("TEST: Analyzer Cache")
+    print("="*70)
+
+    from swarm.analyzer import TaskAnalyzer
+
+    class FlakyClient:
+        """Stands in for ollama.Client; fails until `up` is set."""
+
+        up = False
+        calls = 0
+
+        def chat(self, **kwargs):
+            self.calls += 1
+            if not self.up:
+                raise ConnectionError("ollama is restarting")
+            reply = '{"type": "review", "complexity": "medium"}'
+            return {"message": {"content": reply}}
+
+    analyzer = TaskAnalyzer({})
+    analyzer._client = client = FlakyClient()
+    goal = "look over my parser"
+
+    # Test 1: Fallback is used but not cached while the model is down
+    assert analyzer.analyze(goal)["type"] == "code"
+    assert goal not in analyzer._cache
+    print("✓ Does not cache the fallback")
+
+    # Test 2: Model is asked again once it is back, then cached
+    client.up = True
+    assert analyzer.analyze(goal)["type"] == "review"
+    assert analyzer.analyze(goal)["type"] == "review"
+    assert client.calls == 2
+    print("✓ Retries the model and caches its verdict")
+
+    print("\n✅ Analyzer Cache: ALL TESTS PASSED")
+
+
+def test_forked_runner():
+    """Test running generated skills in a forked interpreter."""
+    print("\n" + "="*70)
+    print("TEST: Forked Skill Runner")
+    print("="*70)
+
+    import os
+    import subprocess
+
+    if not hasattr(os, "fork"):
+        print("✓ Skipped (no os.fork on this platform)")
+        return
+
+    from swarm.orchestrator import SwarmOrchestrator
+    from swarm.voter import SwarmVoter
+
+    orch = SwarmOrchestrator(
+        None, None, None, None, None, None, SwarmVoter(None, None), None
+    )
+    run = orch._run_forked
+
+    # Test 1: Passing code
+    assert run("print('hi')", 5) == (0, "hi\n", "")
+    assert orch._test("print('hi')")["success"]
+    print("✓ Passing code exits 0 with its output")
+
+    # Test 2: Uncaught exception
+    code, _, err = run("raise ValueError('boom')", 5)
+    assert code == 1 and "ValueError: boom" in err
+    assert not orch._test("raise ValueError('boom')")["success"]
+    print("✓ Exceptions fail with a traceback")
+
+    # Test 3: sys.exit with a message or a code
+    assert run("raise SystemExit('msg')", 5) == (1, "", "msg\n")
+    assert run("import sys; sys.exit(3)", 5)[0] == 3
+    assert run("import sys; sys.exit()", 5)[0] == 0
+    print("✓ SystemExit behaves like python3")
+
+    # Test 4: Syntax errors are reported without forking
+    code, _, err = run("def broken(:", 5)
+    assert code == 1 and "SyntaxError" in err
+    print("✓ Reports syntax errors")
+
+    # Test 5: Timeout kills the child
+    try:
+        run("while True: pass", 0.5)
+        assert False, "Should time out"
+    except subprocess.TimeoutExpired:
+        pass
+    print("✓ Times out runaway code")
+
+    # Test 6: Non-daemon threads are joined before exit
+    threaded = (
+        "import threading, time\n"
+        "def work():\n"
+        "    time.sleep(0.2)\n"
+        "    print('from thread')\n"
+        "threading.Thread(target=work).start()\n"
+    )
+    assert run(threaded, 5) == (0, "from thread\n", "")
+    print("✓ Waits for threads started by the skill")
+
+    # Test 7: Voter pool threads are stopped before forking
+    import threading
+    import time
+
+    orch.voter._pool.submit(time.sleep, 0.1)
+    assert threading.active_count() > 1
+    assert run("print('ok')", 5)[0] == 0
+    assert threading.active_count() == 1
+    print("✓ Forks only after voter threads stop")
+
+    # Test 8: Child is killed if the parent is interrupted
+    import signal
+
+    def interrupt(signum, frame):
+        raise KeyboardInterrupt
+
+    previous = signal.signal(signal.SIGALRM, interrupt)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 0.2)
+        run("import time; time.sleep(30)", 10)
+        assert False, "Should be interrupted"
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+    try:
+        os.waitpid(-1, os.WNOHANG)
+        assert False, "Child should already be reaped"
+    except ChildProcessError:
+        pass
+    print("✓ Kills and reaps the child on interruption")
+
+    print("\n✅ Forked Skill Runner: ALL TESTS PASSED")
+
+
+def test_conversation_history():
+    """Test loading conversation history from disk."""
+    print("\n" + "="*70)
+    print("TEST: Conversation History")
+    print("="*70)
+
+    import json
+    import tempfile
+
+    from swarm.conversation import ConversationManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_dir = Path(tmpdir)
+
+        # Test 1: Old JSON list file is imported once
+        legacy = [
+            {"role": "user", "content": "hi", "timestamp": "t1"},
+            {"role": "assistant", "content": "hello", "timestamp": "t2"},
+        ]
+        (config_dir / "conversation_history.json").write_text(json.dumps(legacy))
+        conv = ConversationManager(config_dir)
+        conv.close()
+        assert [m["content"] for m in conv.get_messages()] == ["hi", "hello"]
+        assert not (config_dir / "conversation_history.json").exists()
+        assert len(ConversationManager(config_dir)) == 2
+        print("✓ Imports history from conversation_history.json")
+
+        # Test 2: Records that aren't messages are skipped
+        (config_dir / "conversation_history.jsonl").write_text(
+            '[1, 2]\n"x"\nnot json\n{"role": "user"}\n'
+            '{"role": "user", "content": "kept"}\n'
+        )
+        conv = ConversationManager(config_dir)
+        conv.close()
+        assert [m["content"] for m in conv.get_messages()] == ["kept"]
+        print("✓ Skips malformed records")
+
+        # Test 3: Messages survive a reload
+        conv.add("assistant", "reply")
+        conv.close()
+        assert len(ConversationManager(config_dir)) == 2
+        print("✓ Persists added messages")
+
+    print("\n✅ Conversation History: ALL TESTS PASSED")
+
+
+def run_all_tests():
+    """Run all test suites."""
+    print("""
+╔═══════════════════════════════════════════════════════════════╗
+║   SWARM - TEST SUITE                                          ║
+╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+    tests = [
+        ("Voter Action Parsing", test_voter_parse_action),
+        ("Intent Classification", test_classify_intent),
+        ("Analyzer Keywords", test_analyzer_keywords),
+        ("Analyzer Cache", test_analyzer_cache),
+        ("Forked Skill Runner", test_forked_runner),
+        ("Conversation History", test_conversation_history),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n❌ {name} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n❌ {name} ERROR: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"TEST SUMMARY: {passed} passed, {failed} failed")
+    print("="*70)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)